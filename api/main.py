@@ -1,23 +1,155 @@
-from fastapi import FastAPI
-from pydantic import BaseModel
-from trinity_core import run_trinity_loop
+import asyncio
+import logging
+import os
+import sys
+from contextlib import asynccontextmanager
+from typing import Annotated, Any
+
+import msgspec
+import orjson
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
+from trinity_core import (
+    CACHE_MAX_TEMPERATURE,
+    CACHE_TTL_SECONDS,
+    get_default_provider,
+    is_offline_completion,
+    iter_trinity_loop_async,
+    run_trinity_loop_async,
+)
+
+# Default response class: orjson renders straight to bytes, much faster than
+# the stdlib encoder (FastAPI's own ORJSONResponse is deprecated upstream)
+class ORJSONResponse(Response):
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on the startup warm-up; an unreachable upstream must not hold
+# back every worker's boot
+WARMUP_TIMEOUT_SECONDS = 2.0
+
+# Warm the shared provider's connection pool at boot so the first user
+# request does not pay for TLS setup and cold upstream routing
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    try:
+        await asyncio.wait_for(
+            get_default_provider().awarmup(), timeout=WARMUP_TIMEOUT_SECONDS
+        )
+    except Exception:
+        logger.warning("LLM warm-up failed; continuing cold", exc_info=True)
+    yield
 
 # Create the FastAPI app instance
-app = FastAPI(title="Trinity Mind API")
+app = FastAPI(
+    title="Trinity Mind API",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
+)
+
+# Error payloads are fixed, so encode them once at import time
+_ERRORS = {
+    400: orjson.dumps({"error": "model rejected the request"}),
+    502: orjson.dumps({"error": "model request failed"}),
+}
+_ERROR_LINES = {status: body + b"\n" for status, body in _ERRORS.items()}
+
+# Upstream 400s are the caller's fault; anything else is a gateway failure
+def _error_status(exc: Exception) -> int:
+    # trinity_core imports openai lazily; if it never loaded, the error
+    # cannot be one of its exceptions
+    openai = sys.modules.get("openai")
+    if openai is not None and isinstance(exc, openai.BadRequestError):
+        return 400
+    return 502
 
 # Define what the API expects as input
-class TrinityRequest(BaseModel):
+class TrinityRequest(msgspec.Struct):
     topic: str
     goal: str = "clarity"
     constraints: str = "realistic"
+    temperature: Annotated[float, msgspec.Meta(ge=0, le=2)] = 0.7
+
+# The routes read the raw body, so publish the request schema to OpenAPI by
+# hand; the struct has no nested types, so its component is inlined
+_, _components = msgspec.json.schema_components([TrinityRequest])
+_REQUEST_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {"application/json": {"schema": _components["TrinityRequest"]}},
+    }
+}
+
+# Decode the raw body with msgspec instead of letting FastAPI build a model
+async def _decode_request(request: Request) -> TrinityRequest:
+    try:
+        return msgspec.json.decode(await request.body(), type=TrinityRequest)
+    except msgspec.DecodeError as exc:  # also covers ValidationError
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
 
 # POST endpoint that runs the Trinity reasoning loop
-@app.post("/trinity/reason")
-def reason(req: TrinityRequest):
-    result = run_trinity_loop(req.topic, req.goal, req.constraints)
-    return result
+@app.post("/trinity/reason", openapi_extra=_REQUEST_BODY)
+async def reason(request: Request) -> Response:
+    req = await _decode_request(request)
+    try:
+        result = await run_trinity_loop_async(
+            req.topic, req.goal, req.constraints, temperature=req.temperature
+        )
+    except Exception as exc:
+        logger.exception("Trinity loop failed")
+        status = _error_status(exc)
+        return Response(
+            content=_ERRORS[status], status_code=status, media_type="application/json"
+        )
+    # Build the bytes directly; skips jsonable_encoder and the response class
+    response = Response(content=orjson.dumps(result), media_type="application/json")
+    # Every phase is served from the completion cache at this temperature,
+    # so clients may reuse the response too -- unless it is the offline echo
+    if req.temperature <= CACHE_MAX_TEMPERATURE and not any(
+        is_offline_completion(output) for output in result.values()
+    ):
+        response.headers["Cache-Control"] = f"max-age={CACHE_TTL_SECONDS}"
+    return response
+
+# Keep this an async generator: a sync one would be iterated in the threadpool
+async def _stream_phases(req: TrinityRequest):
+    try:
+        async for phase, data in iter_trinity_loop_async(
+            req.topic, req.goal, req.constraints, temperature=req.temperature
+        ):
+            yield orjson.dumps(
+                {"phase": phase, "data": data}, option=orjson.OPT_APPEND_NEWLINE
+            )
+    except Exception as exc:
+        # Headers are already sent, so report the failure as a final line
+        logger.exception("Trinity loop failed mid-stream")
+        yield _ERROR_LINES[_error_status(exc)]
+
+# Streaming variant: one NDJSON line per phase, sent as soon as it completes
+@app.post("/trinity/reason/stream", openapi_extra=_REQUEST_BODY)
+async def reason_stream(request: Request) -> StreamingResponse:
+    req = await _decode_request(request)
+    return StreamingResponse(_stream_phases(req), media_type="application/x-ndjson")
 
 # Optional health check route
 @app.get("/")
 def root():
     return {"message": "Trinity Mind API is running"}
+
+# Production entry point: uvloop + httptools, one worker per CPU core.
+# Run from the repo root with ``python -m api.main``.
+if __name__ == "__main__":
+    import uvicorn
+
+    uvicorn.run(
+        "api.main:app",
+        host=os.environ.get("HOST", "127.0.0.1"),
+        port=int(os.environ.get("PORT", "8000")),
+        loop="uvloop",
+        http="httptools",
+        workers=os.cpu_count() or 1,
+    )
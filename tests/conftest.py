@@ -0,0 +1,33 @@
+"""Shared fixtures: an OpenAIProvider whose real SDK clients talk to an
+``httpx.MockTransport`` instead of the network."""
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+
+@pytest.fixture
+def openai_provider(monkeypatch):
+    """Factory for providers backed by the real SDK over a mocked transport."""
+
+    httpx = pytest.importorskip("httpx")
+    pytest.importorskip("openai")
+    import trinity_core
+
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+
+    def make(handler, **kwargs: Any) -> "trinity_core.OpenAIProvider":
+        transport = httpx.MockTransport(handler)
+
+        def http_client(*, asynchronous: bool) -> Any:
+            client_cls = httpx.AsyncClient if asynchronous else httpx.Client
+            return client_cls(transport=transport)
+
+        monkeypatch.setattr(
+            trinity_core.OpenAIProvider, "_http_client", staticmethod(http_client)
+        )
+        kwargs.setdefault("cache", None)
+        return trinity_core.OpenAIProvider(**kwargs)
+
+    return make
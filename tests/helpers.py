@@ -0,0 +1,66 @@
+"""Canned Chat Completions payloads for driving the SDK over ``httpx.MockTransport``."""
+from __future__ import annotations
+
+import json
+from typing import Any, Callable, Dict, List, Optional
+
+
+def chat_completion(content: Optional[str], finish_reason: str = "stop") -> Dict[str, Any]:
+    return {
+        "id": "chatcmpl-test",
+        "object": "chat.completion",
+        "created": 0,
+        "model": "test",
+        "choices": [
+            {
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": finish_reason,
+            }
+        ],
+    }
+
+
+def sse_body(tokens: List[str]) -> bytes:
+    events = []
+    for token in tokens:
+        chunk = {
+            "id": "chatcmpl-test",
+            "object": "chat.completion.chunk",
+            "created": 0,
+            "model": "test",
+            "choices": [{"index": 0, "delta": {"content": token}, "finish_reason": None}],
+        }
+        events.append(f"data: {json.dumps(chunk)}\n\n")
+    events.append("data: [DONE]\n\n")
+    return "".join(events).encode("utf-8")
+
+
+def reply_handler(
+    reply: Callable[[Dict[str, Any]], Optional[str]],
+    calls: Optional[List[Dict[str, Any]]] = None,
+) -> Callable[[Any], Any]:
+    """Build a transport handler answering every chat request with ``reply(body)``.
+
+    Streaming requests get the reply split into one SSE chunk per word.
+    """
+
+    import httpx
+
+    def handler(request: "httpx.Request") -> "httpx.Response":
+        body = json.loads(request.content)
+        if calls is not None:
+            calls.append(body)
+        text = reply(body)
+        if body.get("stream"):
+            tokens = [word + " " for word in (text or "").split(" ")]
+            return httpx.Response(
+                200, headers={"content-type": "text/event-stream"}, content=sse_body(tokens)
+            )
+        return httpx.Response(200, json=chat_completion(text))
+
+    return handler
+
+
+def prompt_of(body: Dict[str, Any]) -> str:
+    return body["messages"][0]["content"]
@@ -0,0 +1,155 @@
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("msgspec")
+pytest.importorskip("orjson")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+import trinity_core  # noqa: E402
+from tests.helpers import prompt_of, reply_handler  # noqa: E402
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """Factory for a TestClient whose loop runs use ``provider``."""
+
+    from api import main
+
+    def make(provider):
+        monkeypatch.setattr(trinity_core, "get_default_provider", lambda: provider)
+        monkeypatch.setattr(main, "get_default_provider", lambda: provider)
+        return TestClient(main.app)
+
+    return make
+
+
+@pytest.fixture
+def offline_provider(monkeypatch):
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    monkeypatch.delenv("TRINITY_LLAMA_MODEL", raising=False)
+    return trinity_core.OpenAIProvider(cache=None)
+
+
+def test_cached_responses_are_cacheable_by_clients(client, openai_provider):
+    provider = openai_provider(reply_handler(lambda body: "re " + prompt_of(body)[:10]))
+
+    body = {"topic": "x", "temperature": 0.1}
+    response = client(provider).post("/trinity/reason", json=body)
+
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == f"max-age={trinity_core.CACHE_TTL_SECONDS}"
+
+
+def test_sampled_responses_are_not_cacheable(client, openai_provider):
+    provider = openai_provider(reply_handler(lambda body: "re"))
+
+    body = {"topic": "x", "temperature": 0.7}
+    response = client(provider).post("/trinity/reason", json=body)
+
+    assert response.status_code == 200
+    assert "cache-control" not in response.headers
+
+
+def test_offline_echo_is_never_cacheable(client, offline_provider):
+    response = client(offline_provider).post(
+        "/trinity/reason", json={"topic": "x", "temperature": 0.1}
+    )
+
+    assert response.status_code == 200
+    assert trinity_core.is_offline_completion(response.json()["generate"])
+    assert "cache-control" not in response.headers
+
+
+def test_reason_returns_every_phase(client, offline_provider):
+    response = client(offline_provider).post("/trinity/reason", json={"topic": "AI Safety"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert list(response.json()) == ["generate", "oppose", "synthesize"]
+    assert "Topic: AI Safety" in response.json()["generate"]
+
+
+@pytest.mark.parametrize(
+    "body",
+    [b"not json", b"{}", b'{"topic": 1}', b'{"topic": "x", "temperature": "hot"}'],
+)
+def test_malformed_bodies_are_rejected_with_422(client, offline_provider, body):
+    app = client(offline_provider)
+
+    for path in ("/trinity/reason", "/trinity/reason/stream"):
+        response = app.post(path, content=body, headers={"content-type": "application/json"})
+        assert response.status_code == 422
+
+
+def test_stream_emits_one_ndjson_line_per_phase(client, offline_provider):
+    import orjson
+
+    response = client(offline_provider).post("/trinity/reason/stream", json={"topic": "x"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = [orjson.loads(line) for line in response.text.splitlines()]
+    assert [line["phase"] for line in lines] == ["generate", "oppose", "synthesize"]
+
+
+def test_openapi_publishes_the_request_body(client, offline_provider):
+    paths = client(offline_provider).get("/openapi.json").json()["paths"]
+
+    for path in ("/trinity/reason", "/trinity/reason/stream"):
+        body = paths[path]["post"]["requestBody"]
+        schema = body["content"]["application/json"]["schema"]
+        assert body["required"] is True
+        assert schema["required"] == ["topic"]
+        assert set(schema["properties"]) == {"topic", "goal", "constraints", "temperature"}
+
+
+def test_slow_warmup_does_not_block_startup(client, monkeypatch):
+    import asyncio
+    import time
+
+    from api import main
+
+    class StuckProvider(trinity_core.LLMProvider):
+        async def awarmup(self):
+            await asyncio.sleep(60)
+
+    monkeypatch.setattr(main, "WARMUP_TIMEOUT_SECONDS", 0.05)
+    started = time.monotonic()
+
+    with client(StuckProvider()) as app:
+        assert app.get("/").status_code == 200
+
+    assert time.monotonic() - started < 5
+
+
+@pytest.mark.parametrize("temperature", [-0.1, 2.5, 5])
+def test_out_of_range_temperature_is_rejected_with_422(client, offline_provider, temperature):
+    app = client(offline_provider)
+
+    for path in ("/trinity/reason", "/trinity/reason/stream"):
+        response = app.post(path, json={"topic": "x", "temperature": temperature})
+        assert response.status_code == 422
+
+
+def _failing_upstream(openai_provider, status):
+    httpx = pytest.importorskip("httpx")
+    return openai_provider(
+        lambda request: httpx.Response(status, json={"error": {"message": "nope"}})
+    )
+
+
+@pytest.mark.parametrize(
+    "upstream, status, error",
+    [(400, 400, "model rejected the request"), (404, 502, "model request failed")],
+)
+def test_upstream_failures_map_to_status(client, openai_provider, upstream, status, error):
+    app = client(_failing_upstream(openai_provider, upstream))
+
+    response = app.post("/trinity/reason", json={"topic": "x"})
+    assert response.status_code == status
+    assert response.json() == {"error": error}
+
+    response = app.post("/trinity/reason/stream", json={"topic": "x"})
+    assert response.status_code == 200
+    assert response.text.splitlines()[-1] == f'{{"error":"{error}"}}'
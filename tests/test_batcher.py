@@ -0,0 +1,82 @@
+import asyncio
+
+import pytest
+
+from tests.helpers import chat_completion, prompt_of, reply_handler
+
+
+def _gather(provider, *prompts):
+    async def run():
+        return await asyncio.wait_for(
+            asyncio.gather(*(provider.acomplete(p) for p in prompts), return_exceptions=True),
+            timeout=3,
+        )
+
+    return asyncio.run(run())
+
+
+def test_concurrent_prompts_resolve_to_their_own_replies(openai_provider):
+    calls = []
+    provider = openai_provider(reply_handler(lambda body: "re: " + prompt_of(body), calls))
+
+    assert _gather(provider, "a", "b", "c") == ["re: a", "re: b", "re: c"]
+    assert sorted(prompt_of(body) for body in calls) == ["a", "b", "c"]
+
+
+def test_none_content_resolves_to_empty_string(openai_provider):
+    provider = openai_provider(
+        reply_handler(lambda body: None if prompt_of(body) == "filtered" else "fine")
+    )
+
+    assert _gather(provider, "filtered", "ok") == ["", "fine"]
+
+
+def test_one_failure_does_not_fail_the_batch(openai_provider):
+    httpx = pytest.importorskip("httpx")
+    ok = reply_handler(lambda body: "fine")
+
+    def handler(request):
+        if b"bad" in request.content:
+            return httpx.Response(400, json={"error": {"message": "bad request"}})
+        return ok(request)
+
+    provider = openai_provider(handler)
+    bad, good = _gather(provider, "bad", "good")
+
+    assert isinstance(bad, Exception) and good == "fine"
+
+
+def test_malformed_reply_fails_only_its_own_future(openai_provider):
+    httpx = pytest.importorskip("httpx")
+    ok = reply_handler(lambda body: "fine")
+
+    def handler(request):
+        if b"empty" in request.content:
+            return httpx.Response(200, json={**chat_completion("x"), "choices": []})
+        return ok(request)
+
+    provider = openai_provider(handler)
+    empty, good = _gather(provider, "empty", "good")
+
+    assert isinstance(empty, IndexError) and good == "fine"
+
+
+def test_cancelled_dispatch_fails_waiting_callers(openai_provider):
+    httpx = pytest.importorskip("httpx")
+
+    async def handler(request):
+        await asyncio.sleep(60)
+        return httpx.Response(500)
+
+    provider = openai_provider(handler)
+
+    async def run():
+        waiter = asyncio.ensure_future(provider.acomplete("slow"))
+        while not provider._inflight:
+            await asyncio.sleep(0.01)
+        for task in list(provider._inflight):
+            task.cancel()
+        return await asyncio.wait_for(waiter, timeout=3)
+
+    with pytest.raises(RuntimeError, match="batch aborted"):
+        asyncio.run(run())
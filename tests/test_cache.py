@@ -0,0 +1,94 @@
+import asyncio
+import threading
+
+import pytest
+
+import trinity_core
+from trinity_core import LLMCache, MemoryCacheBackend
+from tests.helpers import prompt_of, reply_handler
+
+
+def test_key_covers_every_sampling_parameter():
+    base = LLMCache.key("m", "prompt", 0.0, 10)
+
+    assert base == LLMCache.key("m", "prompt", 0.0, 10)
+    assert len(
+        {
+            base,
+            LLMCache.key("other", "prompt", 0.0, 10),
+            LLMCache.key("m", "other", 0.0, 10),
+            LLMCache.key("m", "prompt", 0.1, 10),
+            LLMCache.key("m", "prompt", 0.0, 11),
+        }
+    ) == 5
+
+
+def test_memory_backend_evicts_least_recently_used():
+    backend = MemoryCacheBackend(maxsize=2)
+    backend.set("a", "1")
+    backend.set("b", "2")
+    backend.get("a")
+    backend.set("c", "3")
+
+    assert (backend.get("a"), backend.get("b"), backend.get("c")) == ("1", None, "3")
+
+
+def test_memory_backend_honours_ttl(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(trinity_core.time, "monotonic", lambda: now[0])
+    backend = MemoryCacheBackend()
+    backend.set("short", "1", ttl=10)
+    backend.set("forever", "2")
+
+    now[0] += 11
+
+    assert backend.get("short") is None
+    assert backend.get("forever") == "2"
+
+
+def test_async_access_offloads_blocking_backends():
+    threads = []
+
+    class RecordingBackend:
+        def __init__(self):
+            self.data = {}
+
+        def get(self, key):
+            threads.append(threading.get_ident())
+            return self.data.get(key)
+
+        def set(self, key, value, ttl=None):
+            threads.append(threading.get_ident())
+            self.data[key] = (value, ttl)
+
+    cache = LLMCache(RecordingBackend(), ttl=5)
+
+    async def run():
+        await cache.aset("k", "v")
+        await cache.aget("k")
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(run())
+
+    assert cache.backend.data == {"k": ("v", 5)}
+    assert len(threads) == 2 and loop_thread not in threads
+
+
+@pytest.mark.parametrize("temperature, upstream_calls", [(0.1, 1), (0.7, 2)])
+def test_provider_serves_deterministic_repeats_from_cache(
+    openai_provider, temperature, upstream_calls
+):
+    calls = []
+    provider = openai_provider(
+        reply_handler(lambda body: "re " + prompt_of(body), calls), cache=LLMCache()
+    )
+
+    async def run():
+        first = await provider.acomplete("hello", temperature=temperature)
+        stream = provider.acomplete_stream("hello", temperature=temperature)
+        return first, "".join([token async for token in stream]).strip()
+
+    assert asyncio.run(asyncio.wait_for(run(), timeout=3)) == ("re hello", "re hello")
+    # acomplete and acomplete_stream use different request shapes but the same
+    # cache entry, so only the first one reaches the API when caching applies.
+    assert len(calls) == upstream_calls
@@ -0,0 +1,92 @@
+import asyncio
+import threading
+import time
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+import trinity_core
+
+
+class FakeLlama:
+    """Stands in for LlamaCppProvider; ``fail`` makes its pool look broken."""
+
+    built = []
+
+    def __init__(self, model_path, fail=False):
+        time.sleep(0.05)  # widen the race between concurrent callers
+        self.model_path = model_path
+        self.fail = fail
+        self.closed = False
+        FakeLlama.built.append(self)
+
+    def complete(self, prompt, **options):
+        if self.fail:
+            raise BrokenProcessPool("worker died")
+        return "local: " + prompt
+
+    async def acomplete(self, prompt, **options):
+        return self.complete(prompt, **options)
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def offline(monkeypatch, tmp_path):
+    """An offline provider whose TRINITY_LLAMA_MODEL points at a real file."""
+
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    model = tmp_path / "model.gguf"
+    model.write_bytes(b"")
+    monkeypatch.setenv("TRINITY_LLAMA_MODEL", str(model))
+    monkeypatch.setattr(FakeLlama, "built", [])
+
+    def make(fail=False):
+        monkeypatch.setattr(
+            trinity_core, "LlamaCppProvider", lambda path: FakeLlama(path, fail=fail)
+        )
+        return trinity_core.OpenAIProvider(cache=None)
+
+    return make
+
+
+def test_missing_model_file_falls_back_to_echo(offline, monkeypatch, tmp_path):
+    provider = offline()
+    monkeypatch.setenv("TRINITY_LLAMA_MODEL", str(tmp_path / "missing.gguf"))
+
+    assert trinity_core.is_offline_completion(provider.complete("hi"))
+    assert FakeLlama.built == []
+
+
+def test_concurrent_callers_share_one_pool(offline):
+    provider = offline()
+    threads = [threading.Thread(target=provider.complete, args=("hi",)) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(FakeLlama.built) == 1
+    assert provider.complete("hi") == "local: hi"
+
+
+def test_broken_pool_is_discarded_and_not_respawned(offline):
+    provider = offline(fail=True)
+
+    assert trinity_core.is_offline_completion(provider.complete("hi"))
+    assert trinity_core.is_offline_completion(asyncio.run(provider.acomplete("hi")))
+
+    assert len(FakeLlama.built) == 1 and FakeLlama.built[0].closed
+
+
+def test_changing_the_model_path_retries_the_local_model(offline, monkeypatch, tmp_path):
+    provider = offline(fail=True)
+    provider.complete("hi")
+
+    other = tmp_path / "other.gguf"
+    other.write_bytes(b"")
+    monkeypatch.setenv("TRINITY_LLAMA_MODEL", str(other))
+    provider.complete("hi")
+
+    assert [llama.model_path for llama in FakeLlama.built][-1] == str(other)
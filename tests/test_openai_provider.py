@@ -0,0 +1,104 @@
+import asyncio
+
+import pytest
+
+from tests.helpers import prompt_of, reply_handler
+
+
+def _no_wait(provider):
+    tenacity = pytest.importorskip("tenacity")
+    assert provider._ensure_clients()
+    provider._retrying = provider._retrying.copy(wait=tenacity.wait_none())
+    provider._aretrying = provider._aretrying.copy(wait=tenacity.wait_none())
+
+
+def test_complete_joins_streamed_chunks(openai_provider):
+    provider = openai_provider(reply_handler(lambda body: "sync reply"))
+    assert provider.complete("hello") == "sync reply"
+
+
+def test_acomplete_awaits_the_sdk_coroutine(openai_provider):
+    provider = openai_provider(reply_handler(lambda body: "async " + prompt_of(body)))
+
+    async def run():
+        return await asyncio.wait_for(provider.acomplete("hello"), timeout=3)
+
+    assert asyncio.run(run()) == "async hello"
+
+
+def test_acomplete_stream_yields_tokens(openai_provider):
+    provider = openai_provider(reply_handler(lambda body: "one two three"))
+
+    async def run():
+        async def collect():
+            return [token async for token in provider.acomplete_stream("hello")]
+
+        return await asyncio.wait_for(collect(), timeout=3)
+
+    assert asyncio.run(run()) == ["one ", "two ", "three "]
+
+
+def test_async_calls_retry_rate_limits(openai_provider):
+    httpx = pytest.importorskip("httpx")
+    ok = reply_handler(lambda body: "after retry")
+    attempts = []
+
+    def handler(request):
+        attempts.append(request)
+        if len(attempts) == 1:
+            return httpx.Response(429, json={"error": {"message": "slow down"}})
+        return ok(request)
+
+    provider = openai_provider(handler)
+    _no_wait(provider)
+
+    async def run():
+        return await asyncio.wait_for(provider.acomplete("hello"), timeout=3)
+
+    assert asyncio.run(run()) == "after retry"
+    assert len(attempts) == 2
+
+
+def test_missing_credentials_do_not_leak_clients(openai_provider, monkeypatch):
+    import trinity_core
+
+    provider = openai_provider(reply_handler(lambda body: "unused"))
+    monkeypatch.delenv("OPENAI_API_KEY")
+    monkeypatch.delenv("TRINITY_LLAMA_MODEL", raising=False)
+    built = []
+    make_client = trinity_core.OpenAIProvider._http_client
+
+    def http_client(*, asynchronous):
+        built.append(make_client(asynchronous=asynchronous))
+        return built[-1]
+
+    monkeypatch.setattr(trinity_core.OpenAIProvider, "_http_client", staticmethod(http_client))
+
+    for _ in range(10):
+        assert provider.complete("hello").startswith("[OFFLINE COMPLETION]")
+    assert len(built) == 1 and built[0].is_closed
+
+    # Once the back-off has passed, fixed credentials are picked up.
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    provider._next_init = 0.0
+    assert provider.complete("hello") == "unused"
+
+
+def test_warmup_never_retries(openai_provider, monkeypatch):
+    httpx = pytest.importorskip("httpx")
+    import trinity_core
+
+    # Without tenacity the SDK's own retries stay enabled for real requests.
+    no_tenacity = staticmethod(lambda openai: (None, None))
+    monkeypatch.setattr(trinity_core.OpenAIProvider, "_retry_policies", no_tenacity)
+    attempts = []
+
+    def handler(request):
+        attempts.append(request)
+        return httpx.Response(503, json={"error": {"message": "unavailable"}})
+
+    provider = openai_provider(handler, strong_model="gpt-4o-mini")
+
+    with pytest.raises(Exception):
+        asyncio.run(asyncio.wait_for(provider.awarmup(), timeout=3))
+    assert len(attempts) == 1
@@ -0,0 +1,29 @@
+import pytest
+
+import trinity_core
+from trinity_core import (
+    GEN_TEMPLATE,
+    OPP_APPROACHES_TEMPLATE,
+    OPP_TENSIONS_TEMPLATE,
+    SYN_TEMPLATE,
+)
+
+# Braces and newlines must pass through the f-strings untouched.
+TEXT = "line one\n{not a field} 100%"
+
+
+@pytest.mark.parametrize(
+    "template, render, fields",
+    [
+        (
+            GEN_TEMPLATE,
+            trinity_core._render_gen,
+            {"topic": TEXT, "goal": "roadmap", "constraints": "6 months"},
+        ),
+        (OPP_TENSIONS_TEMPLATE, trinity_core._render_opp_tensions, {"generated": TEXT}),
+        (OPP_APPROACHES_TEMPLATE, trinity_core._render_opp_approaches, {"generated": TEXT}),
+        (SYN_TEMPLATE, trinity_core._render_syn, {"opposed": TEXT}),
+    ],
+)
+def test_renderers_match_public_templates(template, render, fields):
+    assert render(**fields) == template.format(**fields)
@@ -0,0 +1,92 @@
+import asyncio
+from collections import OrderedDict
+
+import pytest
+
+import trinity_core
+from trinity_core import LLMProvider, SPECULATION_PREFIX_TOKENS, run_trinity_loop_async
+
+TOKENS = [f"t{i} " for i in range(SPECULATION_PREFIX_TOKENS + 8)]
+OUTPUT = "".join(TOKENS).strip()
+
+
+class ScriptedProvider(LLMProvider):
+    """Streams ``tokens`` for Generate and answers other prompts after a pause."""
+
+    def __init__(self, tokens, oppose_delay=0.0):
+        self.tokens = tokens
+        self.oppose_delay = oppose_delay
+        self.events = []
+        self.cancelled = []
+
+    async def acomplete_stream(self, prompt, **options):
+        for token in self.tokens:
+            await asyncio.sleep(0)
+            self.events.append("token")
+            yield token
+        self.events.append("generate done")
+
+    async def acomplete(self, prompt, **options):
+        self.events.append(prompt)
+        try:
+            await asyncio.sleep(self.oppose_delay)
+        except asyncio.CancelledError:
+            self.cancelled.append(prompt)
+            raise
+        return "reply to " + prompt.split("\n")[1]
+
+
+@pytest.fixture(autouse=True)
+def fresh_history(monkeypatch):
+    monkeypatch.setattr(trinity_core, "_GENERATE_HISTORY", OrderedDict())
+
+
+def _run(provider, temperature):
+    async def run():
+        return await asyncio.wait_for(
+            run_trinity_loop_async("topic", provider=provider, temperature=temperature),
+            timeout=3,
+        )
+
+    return asyncio.run(run())
+
+
+def _oppose_prompts(provider):
+    return [e for e in provider.events if e.startswith(("Oppose", "Compare"))]
+
+
+def test_matching_prediction_starts_oppose_before_generate_finishes():
+    _run(ScriptedProvider(TOKENS), temperature=0.1)
+    provider = ScriptedProvider(TOKENS)
+
+    result = _run(provider, temperature=0.1)
+
+    first_oppose = provider.events.index(_oppose_prompts(provider)[0])
+    assert first_oppose < provider.events.index("generate done")
+    # The speculative Oppose result is used as-is, not re-issued.
+    assert len(_oppose_prompts(provider)) == 2
+    assert result["oppose"] == f"reply to {OUTPUT}\n\nreply to {OUTPUT}"
+
+
+def test_diverging_output_cancels_speculation_and_reissues_oppose():
+    _run(ScriptedProvider(TOKENS), temperature=0.1)
+    diverged = TOKENS[:-1] + ["changed "]
+    provider = ScriptedProvider(diverged, oppose_delay=0.05)
+
+    result = _run(provider, temperature=0.1)
+
+    assert len(provider.cancelled) == 2
+    assert len(_oppose_prompts(provider)) == 4
+    real = "".join(diverged).strip()
+    assert result["oppose"] == f"reply to {real}\n\nreply to {real}"
+
+
+def test_no_speculation_at_high_temperature():
+    _run(ScriptedProvider(TOKENS), temperature=0.7)
+    provider = ScriptedProvider(TOKENS)
+
+    _run(provider, temperature=0.7)
+
+    first_oppose = provider.events.index(_oppose_prompts(provider)[0])
+    assert first_oppose > provider.events.index("generate done")
+    assert trinity_core._GENERATE_HISTORY == OrderedDict()
@@ -0,0 +1,46 @@
+import asyncio
+
+from trinity_core import LLMProvider, run_trinity_loop, run_trinity_loop_async
+
+
+class LegacyProvider(LLMProvider):
+    """Written against the pre-tier ``complete`` signature."""
+
+    def complete(self, prompt, *, temperature=0.7, max_tokens=800):
+        return prompt.split("\n")[0]
+
+
+class TieredProvider(LLMProvider):
+    def __init__(self):
+        self.tiers = {}
+
+    def complete(self, prompt, *, temperature=0.7, max_tokens=800, tier="fast"):
+        phase = prompt.split(" ")[0]
+        self.tiers.setdefault(phase, set()).add(tier)
+        return phase
+
+
+def test_legacy_providers_still_run_both_loops():
+    expected = {
+        "generate": "Topic: x",
+        "oppose": "Oppose the following:\n\nCompare the following:",
+        "synthesize": "Fuse these perspectives:",
+    }
+
+    assert run_trinity_loop("x", provider=LegacyProvider()) == expected
+    assert asyncio.run(run_trinity_loop_async("x", provider=LegacyProvider())) == expected
+
+
+def test_each_phase_gets_its_tier():
+    for run in (
+        lambda p: run_trinity_loop("x", provider=p),
+        lambda p: asyncio.run(run_trinity_loop_async("x", provider=p)),
+    ):
+        provider = TieredProvider()
+        run(provider)
+        assert provider.tiers == {
+            "Topic:": {"fast"},
+            "Oppose": {"fast"},
+            "Compare": {"fast"},
+            "Fuse": {"strong"},
+        }
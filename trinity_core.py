@@ -6,9 +6,55 @@ FastAPI service, a CLI script, or unit tests.
 """
 from __future__ import annotations
 
-import json
-from dataclasses import dataclass
-from typing import Dict, Optional
+import asyncio
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import BrokenExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    List,
+    Literal,
+    NamedTuple,
+    Optional,
+    Protocol,
+    Set,
+    Tuple,
+)
+
+# The CLI helpers (``run_moonlander_cli``/``main``) are deliberately left out so
+# ``from trinity_core import *`` only exposes the library surface.
+__all__ = (
+    "CACHE_MAX_TEMPERATURE",
+    "CACHE_TTL_SECONDS",
+    "DEFAULT_CACHE",
+    "DEFAULT_TIERS",
+    "GEN_TEMPLATE",
+    "OFFLINE_HEADER",
+    "OPP_APPROACHES_TEMPLATE",
+    "OPP_TENSIONS_TEMPLATE",
+    "SYN_TEMPLATE",
+    "CacheBackend",
+    "LLMCache",
+    "LLMProvider",
+    "LlamaCppProvider",
+    "MemoryCacheBackend",
+    "OpenAIProvider",
+    "RedisCacheBackend",
+    "Tier",
+    "TrinityConfig",
+    "boot_moonlander_mode",
+    "get_default_provider",
+    "is_offline_completion",
+    "iter_trinity_loop_async",
+    "run_trinity_loop",
+    "run_trinity_loop_async",
+)
 
 
 GEN_TEMPLATE = (
@@ -17,10 +63,16 @@ GEN_TEMPLATE = (
     "Constraints: {constraints}\n"
     "Generate 5 approaches."
 )
-OPP_TEMPLATE = (
+# The Oppose phase is two independent sub-queries so they can run concurrently.
+OPP_TENSIONS_TEMPLATE = (
     "Oppose the following:\n"
     "{generated}\n"
-    "List tensions, risks, and the top 2 approaches."
+    "List the tensions and risks."
+)
+OPP_APPROACHES_TEMPLATE = (
+    "Compare the following:\n"
+    "{generated}\n"
+    "Pick the top 2 approaches and justify the choice."
 )
 SYN_TEMPLATE = (
     "Fuse these perspectives:\n"
@@ -29,64 +81,818 @@ SYN_TEMPLATE = (
 )
 
 
+# Pre-compiled renderers for the templates above.  f-strings avoid re-parsing
+# the template through ``str.format`` on every call.  tests/test_prompts.py
+# checks each one against its public ``*_TEMPLATE`` constant.
+def _render_gen(topic: str, goal: str, constraints: str) -> str:
+    return (
+        f"Topic: {topic}\n"
+        f"Goal: {goal}\n"
+        f"Constraints: {constraints}\n"
+        "Generate 5 approaches."
+    )
+
+
+def _render_opp_tensions(generated: str) -> str:
+    return f"Oppose the following:\n{generated}\nList the tensions and risks."
+
+
+def _render_opp_approaches(generated: str) -> str:
+    return (
+        f"Compare the following:\n{generated}\n"
+        "Pick the top 2 approaches and justify the choice."
+    )
+
+
+def _join_oppose(tensions: str, approaches: str) -> str:
+    return f"{tensions}\n\n{approaches}"
+
+
+def _render_syn(opposed: str) -> str:
+    return (
+        f"Fuse these perspectives:\n{opposed}\n"
+        "Return a final plan, rationale, metrics, and risks."
+    )
+
+
+@lru_cache(maxsize=16)
+def _phase_temps(temperature: float) -> Tuple[float, float, float]:
+    """Sampling temperatures for (Generate, Oppose, Synthesize).
+
+    Synthesize runs 0.2 cooler than the base temperature (floored at zero) to
+    favour a focused final plan.  Memoized: callers use only a few values.
+    """
+
+    return temperature, temperature, max(0.0, temperature - 0.2)
+
+
+# Output budget per phase.  Generation time grows roughly linearly with output
+# tokens, so each phase only gets the room it typically needs; each Oppose
+# sub-query gets the "opp" budget.
+_MAX_TOKENS: Dict[str, int] = {"gen": 500, "opp": 250, "syn": 700}
+
+Tier = Literal["fast", "strong"]
+
+# Model tier used for (Generate, Oppose, Synthesize).  Generate and Oppose are
+# drafting work a cheap model handles; Synthesize gets the strong model.
+DEFAULT_TIERS: Tuple[Tier, Tier, Tier] = ("fast", "fast", "strong")
+
+# Below this temperature Generate is close to deterministic, so the previous
+# output for the same prompt is a good predictor of the next one and the Oppose
+# phase can be started speculatively while Generate is still streaming.
+SPECULATION_MAX_TEMPERATURE = 0.3
+SPECULATION_PREFIX_TOKENS = 128
+_GENERATE_HISTORY_SIZE = 256
+_GENERATE_HISTORY: "OrderedDict[str, str]" = OrderedDict()
+
+# Completions at or below this temperature are treated as deterministic and
+# served from the completion cache.
+CACHE_MAX_TEMPERATURE = 0.2
+CACHE_TTL_SECONDS = 3600
+
+# First line of the placeholder echoed when no model is reachable.
+OFFLINE_HEADER = "[OFFLINE COMPLETION]"
+
+# Minimum delay before OpenAIProvider retries building its SDK clients after a
+# failed import or construction.
+CLIENT_RETRY_SECONDS = 30.0
+
+
+def is_offline_completion(text: str) -> bool:
+    """Return whether ``text`` is the offline echo rather than model output."""
+
+    return text.startswith(OFFLINE_HEADER)
+
+
+class CacheBackend(Protocol):
+    """Storage used by :class:`LLMCache`."""
+
+    def get(self, key: str) -> Optional[str]:
+        ...
+
+    def set(self, key: str, value: str, ttl: Optional[int] = None) -> None:
+        ...
+
+
+class MemoryCacheBackend:
+    """In-process LRU backend; entries also expire after their ``ttl``."""
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        self.maxsize = maxsize
+        # key -> (monotonic expiry or None, value)
+        self._data: "OrderedDict[str, Tuple[Optional[float], str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if expires is not None and expires <= time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str, ttl: Optional[int] = None) -> None:
+        expires = None if ttl is None else time.monotonic() + ttl
+        with self._lock:
+            self._data[key] = (expires, value)
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+
+class RedisCacheBackend:
+    """Backend storing completions in Redis so they survive restarts and are
+    shared between API workers.  Requires the optional :mod:`redis` package.
+
+    The client is synchronous; :class:`LLMCache` runs it in a worker thread
+    when called from async code.
+    """
+
+    def __init__(
+        self, url: str = "redis://localhost:6379/0", *, prefix: str = "trinity:"
+    ) -> None:
+        import redis  # type: ignore
+
+        self._redis = redis.Redis.from_url(url)
+        self.prefix = prefix
+
+    def get(self, key: str) -> Optional[str]:
+        value = self._redis.get(self.prefix + key)
+        return None if value is None else value.decode("utf-8")
+
+    def set(self, key: str, value: str, ttl: Optional[int] = None) -> None:
+        self._redis.set(self.prefix + key, value, ex=ttl)
+
+
+class LLMCache:
+    """Content-addressed cache for deterministic completions.
+
+    Entries are keyed by the SHA-256 of the model, prompt and sampling
+    parameters, so identical requests skip the model call entirely.
+    """
+
+    def __init__(
+        self, backend: Optional[CacheBackend] = None, *, ttl: Optional[int] = CACHE_TTL_SECONDS
+    ) -> None:
+        self.backend = backend if backend is not None else MemoryCacheBackend()
+        self.ttl = ttl
+
+    @staticmethod
+    def key(model: str, prompt: str, temperature: float, max_tokens: int) -> str:
+        # NUL-separated with the free-form prompt last, so the encoding is
+        # unambiguous without pulling in :mod:`json` at import time.
+        payload = f"{model}\0{temperature!r}\0{max_tokens}\0{prompt}"
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        return self.backend.get(key)
+
+    def set(self, key: str, value: str) -> None:
+        self.backend.set(key, value, self.ttl)
+
+    # Async variants for use on the event loop.  Only the in-process backend is
+    # called inline; anything else may block on network I/O, so it runs in a
+    # worker thread.
+    async def aget(self, key: str) -> Optional[str]:
+        if isinstance(self.backend, MemoryCacheBackend):
+            return self.backend.get(key)
+        return await asyncio.to_thread(self.backend.get, key)
+
+    async def aset(self, key: str, value: str) -> None:
+        if isinstance(self.backend, MemoryCacheBackend):
+            self.backend.set(key, value, self.ttl)
+        else:
+            await asyncio.to_thread(self.backend.set, key, value, self.ttl)
+
+
+# Process-wide cache shared by providers that do not bring their own.
+DEFAULT_CACHE = LLMCache()
+
+
+@lru_cache(maxsize=64)
+def _accepts_tier(func: Any) -> bool:
+    import inspect
+
+    try:
+        params = inspect.signature(func).parameters.values()
+    except (TypeError, ValueError):
+        return True
+    return any(p.name == "tier" or p.kind is p.VAR_KEYWORD for p in params)
+
+
+def _tier_option(method: Any, tier: Tier) -> Dict[str, Any]:
+    """Return ``{"tier": tier}`` if ``method`` takes it, else ``{}``.
+
+    Providers written before tiers existed implement
+    ``complete(prompt, *, temperature, max_tokens)``; they serve a single
+    model, so they are simply called without ``tier``.
+    """
+
+    return {"tier": tier} if _accepts_tier(getattr(method, "__func__", method)) else {}
+
+
 class LLMProvider:
     """Abstract provider used to fetch model completions."""
 
-    def complete(self, prompt: str, *, temperature: float = 0.7, max_tokens: int = 800) -> str:
+    def complete(
+        self,
+        prompt: str,
+        *,
+        temperature: float = 0.7,
+        max_tokens: int = 800,
+        tier: Tier = "fast",
+    ) -> str:
         """Return a model completion for ``prompt``.
 
-        Concrete subclasses are expected to implement this and raise a
-        ``NotImplementedError`` when the model cannot be accessed.
+        ``tier`` selects between a cheap ``"fast"`` model and a ``"strong"``
+        one; providers with a single model may ignore it.  Concrete subclasses
+        are expected to implement this and raise a ``NotImplementedError``
+        when the model cannot be accessed.
         """
 
         raise NotImplementedError
 
+    async def acomplete(
+        self,
+        prompt: str,
+        *,
+        temperature: float = 0.7,
+        max_tokens: int = 800,
+        tier: Tier = "fast",
+    ) -> str:
+        """Asynchronous counterpart of :meth:`complete`.
+
+        The default implementation runs :meth:`complete` in a worker thread so
+        that existing synchronous providers keep working from async callers.
+        Providers with a native async client should override this.
+        """
+
+        return await asyncio.to_thread(
+            self.complete,
+            prompt,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            **_tier_option(self.complete, tier),
+        )
+
+    async def acomplete_stream(
+        self,
+        prompt: str,
+        *,
+        temperature: float = 0.7,
+        max_tokens: int = 800,
+        tier: Tier = "fast",
+    ) -> AsyncIterator[str]:
+        """Yield the completion for ``prompt`` incrementally.
+
+        The default implementation yields the :meth:`acomplete` result as a
+        single chunk; providers that support token streaming should override it.
+        """
+
+        yield await self.acomplete(
+            prompt,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            **_tier_option(self.acomplete, tier),
+        )
+
+    async def awarmup(self) -> None:
+        """Prime connections to the backend before the first real request.
+
+        A no-op by default; network-backed providers override it.
+        """
+
+
+# Model replica owned by the current LlamaCppProvider worker process.
+_LLAMA: Any = None
+
+
+def _load_llama_model(model_path: str, n_ctx: int) -> None:
+    """Process-pool initializer: load one model replica per worker."""
+
+    global _LLAMA
+    import llama_cpp  # type: ignore
+
+    _LLAMA = llama_cpp.Llama(model_path=model_path, n_ctx=n_ctx, verbose=False)
+
+
+def _llama_infer(prompt: str, temperature: float, max_tokens: int) -> str:
+    response = _LLAMA.create_chat_completion(
+        messages=[{"role": "user", "content": prompt}],
+        temperature=temperature,
+        max_tokens=max_tokens,
+    )
+    return response["choices"][0]["message"]["content"].strip()
+
+
+class LlamaCppProvider(LLMProvider):
+    """Provider running a local GGUF model through :mod:`llama_cpp`.
+
+    Inference runs in a process pool holding one model replica per worker, so
+    concurrent requests are not serialized behind a single model instance.
+    Requires the optional ``llama-cpp-python`` package.  There is only one
+    local model, so ``tier`` is ignored.
+    """
+
+    def __init__(
+        self, model_path: str, *, workers: Optional[int] = None, n_ctx: int = 4096
+    ) -> None:
+        import llama_cpp  # type: ignore # noqa: F401  (fail fast when missing)
+
+        # Imported here so the API and CLI do not load multiprocessing at
+        # import time just for this optional provider.
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        self.model_path = model_path
+        # ``spawn`` keeps workers from inheriting the parent's threads and
+        # event loop state.
+        self._pool = ProcessPoolExecutor(
+            max_workers=workers or max(1, (os.cpu_count() or 1) // 4),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_load_llama_model,
+            initargs=(model_path, n_ctx),
+        )
+
+    def complete(
+        self,
+        prompt: str,
+        *,
+        temperature: float = 0.7,
+        max_tokens: int = 800,
+        tier: Tier = "fast",
+    ) -> str:
+        return self._pool.submit(_llama_infer, prompt, temperature, max_tokens).result()
+
+    async def acomplete(
+        self,
+        prompt: str,
+        *,
+        temperature: float = 0.7,
+        max_tokens: int = 800,
+        tier: Tier = "fast",
+    ) -> str:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._pool, _llama_infer, prompt, temperature, max_tokens
+        )
+
+    def close(self) -> None:
+        """Stop the worker processes without waiting for queued requests."""
+
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+# ``(prompt, request options, future)`` queued for the async micro-batcher.
+_BatchItem = Tuple[str, Dict[str, Any], "asyncio.Future[str]"]
+
 
 class OpenAIProvider(LLMProvider):
     """Provider backed by the OpenAI Chat Completions API.
 
-    The constructor attempts to import :mod:`openai`.  When this fails (for
-    example in CI or an air-gapped environment) we fall back to an extremely
-    simple echo implementation.  This allows the rest of the codebase to run in
-    tests without requiring network access or credentials.
+    The :mod:`openai` clients are built lazily on first use.  When the import
+    fails (for example in CI or an air-gapped environment) we fall back to a
+    local :class:`LlamaCppProvider` if ``TRINITY_LLAMA_MODEL`` points at a
+    model file, and otherwise to an extremely simple echo implementation; the
+    import is tried again after ``CLIENT_RETRY_SECONDS``.  This allows the rest of the
+    codebase to run in tests without requiring network access or credentials.
+
+    ``model`` serves the ``"fast"`` tier and ``strong_model`` the ``"strong"``
+    tier.
+
+    Completions requested at ``temperature <= CACHE_MAX_TEMPERATURE`` are
+    looked up in ``cache`` first (the in-memory :data:`DEFAULT_CACHE` unless
+    another :class:`LLMCache` is given; pass ``cache=None`` to disable it).
+
+    Async completions are routed through a small micro-batcher: prompts that
+    arrive within ``batch_window`` seconds of each other are dispatched
+    together (up to ``max_batch`` at a time) over one shared HTTP/2 client, so
+    concurrent API requests multiplex on the same connection instead of each
+    paying for its own.
     """
 
-    def __init__(self, model: str = "gpt-4o-mini") -> None:
-        self.model = model
+    def __init__(
+        self,
+        model: str = "gpt-4o-mini",
+        *,
+        strong_model: str = "gpt-4o",
+        max_batch: int = 16,
+        batch_window: float = 0.005,
+        cache: Optional[LLMCache] = DEFAULT_CACHE,
+    ) -> None:
+        self._models: Dict[str, str] = {"fast": model, "strong": strong_model}
+        self.cache = cache
+        self.max_batch = max_batch
+        self.batch_window = batch_window
         self._client = None
-        try:
-            import openai  # type: ignore
+        self._async_client = None
+        self._retrying: Any = None
+        self._aretrying: Any = None
+        self._init_lock = threading.Lock()
+        self._next_init = 0.0
+        self._local: Optional[LlamaCppProvider] = None
+        self._broken_model: Optional[str] = None
+        self._queue: Optional["asyncio.Queue[_BatchItem]"] = None
+        self._batch_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._inflight: Set["asyncio.Task[None]"] = set()
+
+    def _ensure_clients(self) -> bool:
+        """Build the SDK clients on first use and report whether they exist.
+
+        A failed import or construction is not remembered for good: it is
+        attempted again once ``CLIENT_RETRY_SECONDS`` have passed, so
+        installing :mod:`openai` or fixing credentials takes effect without
+        restarting the process.
+        """
+
+        if self._client is not None:
+            return True
+        if time.monotonic() < self._next_init:
+            return False
+        with self._init_lock:
+            if self._client is None:
+                if time.monotonic() < self._next_init:
+                    return False
+                try:
+                    self._build_clients()
+                except Exception:
+                    # The SDK or its credentials are not available – serve the
+                    # degraded but deterministic fallback so the engine is
+                    # still usable during tests.
+                    self._next_init = time.monotonic() + CLIENT_RETRY_SECONDS
+                    return False
+        return True
 
-            self._client = openai.OpenAI()
-            self._ok = True
+    def _build_clients(self) -> None:
+        import openai  # type: ignore
+
+        retrying, aretrying = self._retry_policies(openai)
+        # With tenacity in charge the SDK's own retries would only multiply
+        # the attempts.
+        max_retries = 0 if retrying is not None else openai.DEFAULT_MAX_RETRIES
+        # The sync client goes first: it fails on missing credentials like the
+        # async one does, but its connection pool can be closed without an
+        # event loop.
+        http_client = self._http_client(asynchronous=False)
+        try:
+            client = openai.OpenAI(http_client=http_client, max_retries=max_retries)
         except Exception:
-            # The SDK is not available – switch to a degraded but deterministic
-            # fallback so the engine is still usable during tests.
-            self._ok = False
+            http_client.close()
+            raise
+        self._async_client = openai.AsyncOpenAI(
+            http_client=self._http_client(asynchronous=True), max_retries=max_retries
+        )
+        self._retrying, self._aretrying = retrying, aretrying
+        self._client = client
+
+    @staticmethod
+    def _retry_policies(openai: Any) -> Tuple[Any, Any]:
+        """Return ``(Retrying, AsyncRetrying)`` for transient API errors.
+
+        Rate limits, timeouts/connection drops and 5xx responses are retried
+        with jittered exponential backoff.  Both are ``None`` when the optional
+        :mod:`tenacity` package is missing.
+        """
+
+        try:
+            import tenacity  # type: ignore
+        except ImportError:
+            return None, None
+
+        policy: Dict[str, Any] = {
+            "retry": tenacity.retry_if_exception_type(
+                (openai.RateLimitError, openai.APIConnectionError, openai.InternalServerError)
+            ),
+            "wait": (
+                tenacity.wait_exponential(multiplier=0.5, max=8) + tenacity.wait_random(0, 1)
+            ),
+            "stop": tenacity.stop_after_attempt(5),
+            "reraise": True,
+        }
+        return tenacity.Retrying(**policy), tenacity.AsyncRetrying(**policy)
+
+    def _call(self, fn: Any, **kwargs: Any) -> Any:
+        if self._retrying is None:
+            return fn(**kwargs)
+        return self._retrying.copy()(fn, **kwargs)
+
+    async def _acall(self, fn: Any, **kwargs: Any) -> Any:
+        if self._aretrying is None:
+            return await fn(**kwargs)
+        # ``AsyncRetrying.__call__`` only awaits coroutine *functions*, and the
+        # SDK's ``create`` is a sync wrapper returning a coroutine, so drive
+        # the attempts explicitly.
+        async for attempt in self._aretrying.copy():
+            with attempt:
+                return await fn(**kwargs)
+
+    @property
+    def model(self) -> str:
+        """Model serving the ``"fast"`` tier.
+
+        Read-only so providers shared through :func:`_get_openai_provider`
+        always match the model they were memoized under.
+        """
+
+        return self._models["fast"]
+
+    @staticmethod
+    def _http_client(*, asynchronous: bool) -> Any:
+        """Build a pooled HTTP/2 client so the phases share warm connections."""
+
+        import httpx  # installed alongside openai
+
+        client_cls = httpx.AsyncClient if asynchronous else httpx.Client
+        options: Dict[str, Any] = {
+            "limits": httpx.Limits(max_keepalive_connections=32, max_connections=64),
+            "timeout": httpx.Timeout(60.0, connect=5.0),
+        }
+        try:
+            return client_cls(http2=True, **options)
+        except ImportError:
+            # HTTP/2 needs the optional ``h2`` package; keep-alive over
+            # HTTP/1.1 is still better than failing outright.
+            return client_cls(**options)
+
+    @staticmethod
+    def _offline(prompt: str) -> str:
+        return f"{OFFLINE_HEADER}\nPrompt: {prompt[:200]}"
+
+    def _local_fallback(self) -> Optional[LlamaCppProvider]:
+        """Return the local model used while the SDK is unavailable, if any.
+
+        Built under the init lock, since the sync Oppose phase calls
+        :meth:`complete` from two threads and each pool holds full model
+        replicas.  A model whose pool broke is not retried until
+        ``TRINITY_LLAMA_MODEL`` changes.
+        """
+
+        model_path = os.environ.get("TRINITY_LLAMA_MODEL")
+        if self._local is not None or not model_path or model_path == self._broken_model:
+            return self._local
+        if not os.path.isfile(model_path):
+            return None
+        with self._init_lock:
+            if self._local is None:
+                try:
+                    self._local = LlamaCppProvider(model_path)
+                except ImportError:
+                    return None
+        return self._local
+
+    def _discard_local(self, local: LlamaCppProvider) -> None:
+        with self._init_lock:
+            if self._local is local:
+                self._local = None
+                self._broken_model = local.model_path
+        local.close()
+
+    def _complete_offline(self, prompt: str, temperature: float, max_tokens: int) -> str:
+        local = self._local_fallback()
+        if local is not None:
+            try:
+                return local.complete(prompt, temperature=temperature, max_tokens=max_tokens)
+            except BrokenExecutor:
+                # A worker died, most often because the model failed to load.
+                self._discard_local(local)
+        return self._offline(prompt)
+
+    async def _acomplete_offline(
+        self, prompt: str, temperature: float, max_tokens: int
+    ) -> str:
+        local = self._local_fallback()
+        if local is not None:
+            try:
+                return await local.acomplete(
+                    prompt, temperature=temperature, max_tokens=max_tokens
+                )
+            except BrokenExecutor:
+                self._discard_local(local)
+        return self._offline(prompt)
+
+    def _cache_key(
+        self, model: str, prompt: str, temperature: float, max_tokens: int
+    ) -> Optional[str]:
+        if self.cache is None or temperature > CACHE_MAX_TEMPERATURE:
+            return None
+        return self.cache.key(model, prompt, temperature, max_tokens)
 
     def complete(
-        self, prompt: str, *, temperature: float = 0.7, max_tokens: int = 800
+        self,
+        prompt: str,
+        *,
+        temperature: float = 0.7,
+        max_tokens: int = 800,
+        tier: Tier = "fast",
+    ) -> str:
+        if not self._ensure_clients():
+            return self._complete_offline(prompt, temperature, max_tokens)
+
+        model = self._models[tier]
+        key = self._cache_key(model, prompt, temperature, max_tokens)
+        if key is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        # Retry the request and stream consumption as one unit so a dropped
+        # stream is re-issued from the start.
+        text = self._call(
+            self._complete_streamed,
+            model=model,
+            messages=[{"role": "user", "content": prompt}],
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
+        if key is not None:
+            self.cache.set(key, text)
+        return text
+
+    def _complete_streamed(self, **request: Any) -> str:
+        stream = self._client.chat.completions.create(stream=True, **request)
+        parts = [chunk.choices[0].delta.content or "" for chunk in stream if chunk.choices]
+        return "".join(parts).strip()
+
+    async def acomplete(
+        self,
+        prompt: str,
+        *,
+        temperature: float = 0.7,
+        max_tokens: int = 800,
+        tier: Tier = "fast",
     ) -> str:
-        if not self._ok or self._client is None:
-            header = "[OFFLINE COMPLETION]"
-            return f"{header}\nPrompt: {prompt[:200]}"
+        if not self._ensure_clients():
+            return await self._acomplete_offline(prompt, temperature, max_tokens)
+
+        model = self._models[tier]
+        key = self._cache_key(model, prompt, temperature, max_tokens)
+        if key is not None:
+            cached = await self.cache.aget(key)
+            if cached is not None:
+                return cached
+
+        future: "asyncio.Future[str]" = asyncio.get_running_loop().create_future()
+        options = {"model": model, "temperature": temperature, "max_tokens": max_tokens}
+        self._batch_queue().put_nowait((prompt, options, future))
+        text = await future
+        if key is not None:
+            await self.cache.aset(key, text)
+        return text
+
+    async def awarmup(self) -> None:
+        # One 1-token request per configured model opens the pooled HTTP/2
+        # connection and warms upstream routing.  It deliberately skips the
+        # cache, the batcher and every retry layer so boot never stalls.
+        if not self._ensure_clients():
+            return
+        client = self._async_client.with_options(max_retries=0)
+        await asyncio.gather(
+            *(
+                client.chat.completions.create(
+                    model=model,
+                    messages=[{"role": "user", "content": "ping"}],
+                    temperature=0.0,
+                    max_tokens=1,
+                )
+                for model in set(self._models.values())
+            )
+        )
+
+    def _batch_queue(self) -> "asyncio.Queue[_BatchItem]":
+        # Queues and tasks belong to one event loop, so the batcher is (re)built
+        # lazily for whichever loop is currently running.
+        loop = asyncio.get_running_loop()
+        if self._queue is None or self._batch_loop is not loop:
+            self._queue = asyncio.Queue()
+            self._batch_loop = loop
+            loop.create_task(self._batch_worker(self._queue))
+        return self._queue
 
-        response = self._client.chat.completions.create(
-            model=self.model,
+    async def _batch_worker(self, queue: "asyncio.Queue[_BatchItem]") -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + self.batch_window
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            # Fire the batch without awaiting it so slow completions never hold
+            # back the next window.
+            task = loop.create_task(self._dispatch_batch(batch))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    async def _dispatch_batch(self, batch: List[_BatchItem]) -> None:
+        try:
+            results = await asyncio.gather(
+                *(
+                    self._acall(
+                        self._async_client.chat.completions.create,
+                        messages=[{"role": "user", "content": prompt}],
+                        **options,
+                    )
+                    for prompt, options, _ in batch
+                ),
+                return_exceptions=True,
+            )
+            for (_, _, future), result in zip(batch, results):
+                if future.done():
+                    continue
+                if isinstance(result, BaseException):
+                    future.set_exception(result)
+                    continue
+                try:
+                    # ``content`` is None for filtered or tool-call replies.
+                    future.set_result((result.choices[0].message.content or "").strip())
+                except Exception as exc:
+                    future.set_exception(exc)
+        except BaseException as exc:
+            # Never leave a caller waiting on a batch that will not finish.
+            error = exc
+            if not isinstance(exc, Exception):
+                error = RuntimeError("completion batch aborted")
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(error)
+            raise
+
+    async def acomplete_stream(
+        self,
+        prompt: str,
+        *,
+        temperature: float = 0.7,
+        max_tokens: int = 800,
+        tier: Tier = "fast",
+    ) -> AsyncIterator[str]:
+        if not self._ensure_clients():
+            yield await self._acomplete_offline(prompt, temperature, max_tokens)
+            return
+
+        model = self._models[tier]
+        key = self._cache_key(model, prompt, temperature, max_tokens)
+        if key is not None:
+            cached = await self.cache.aget(key)
+            if cached is not None:
+                yield cached
+                return
+
+        parts: list[str] = []
+        # Only opening the stream is retried; chunks already yielded cannot be
+        # taken back.
+        stream = await self._acall(
+            self._async_client.chat.completions.create,
+            model=model,
             messages=[{"role": "user", "content": prompt}],
             temperature=temperature,
             max_tokens=max_tokens,
+            stream=True,
         )
-        return response.choices[0].message.content.strip()
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                parts.append(chunk.choices[0].delta.content)
+                yield parts[-1]
+        if key is not None:
+            await self.cache.aset(key, "".join(parts).strip())
+
+
+@lru_cache(maxsize=8)
+def _get_openai_provider(model: str = "gpt-4o-mini") -> OpenAIProvider:
+    """Return a shared :class:`OpenAIProvider` for ``model``.
+
+    Memoized so repeated callers reuse the same SDK clients and connection
+    pool instead of re-importing :mod:`openai` and re-building them.
+    """
 
+    return OpenAIProvider(model)
 
-@dataclass
-class TrinityConfig:
-    """Input configuration for a Trinity reasoning pass."""
+
+def get_default_provider() -> LLMProvider:
+    """Return the process-wide provider used when callers do not pass one."""
+
+    return _get_openai_provider()
+
+
+class TrinityConfig(NamedTuple):
+    """Input configuration for a Trinity reasoning pass.
+
+    ``tiers`` picks the model tier for the Generate, Oppose and Synthesize
+    phases respectively.  Being a tuple, a config is immutable and hashable,
+    so it can be used directly as a cache key.
+    """
 
     topic: str
     goal: str = "clarity"
     constraints: str = "realistic"
+    tiers: Tuple[Tier, Tier, Tier] = DEFAULT_TIERS
 
 
 def run_trinity_loop(
@@ -96,23 +902,204 @@ def run_trinity_loop(
     *,
     provider: Optional[LLMProvider] = None,
     temperature: float = 0.7,
+    tiers: Tuple[Tier, Tier, Tier] = DEFAULT_TIERS,
 ) -> Dict[str, str]:
     """Execute the Generate → Oppose → Synthesize reasoning pipeline."""
 
-    provider = provider or OpenAIProvider()
+    provider = provider or get_default_provider()
+    t_gen, t_opp, t_syn = _phase_temps(temperature)
+    gen_tier, opp_tier, syn_tier = tiers
 
-    gen_prompt = GEN_TEMPLATE.format(topic=topic, goal=goal, constraints=constraints)
-    generated = provider.complete(gen_prompt, temperature=temperature)
+    gen_prompt = _render_gen(topic, goal, constraints)
+    generated = provider.complete(
+        gen_prompt,
+        temperature=t_gen,
+        max_tokens=_MAX_TOKENS["gen"],
+        **_tier_option(provider.complete, gen_tier),
+    )
 
-    opp_prompt = OPP_TEMPLATE.format(generated=generated)
-    opposed = provider.complete(opp_prompt, temperature=temperature)
+    opposed = _oppose(provider, generated, t_opp, opp_tier)
 
-    syn_prompt = SYN_TEMPLATE.format(opposed=opposed)
-    synthesized = provider.complete(syn_prompt, temperature=max(0.0, temperature - 0.2))
+    syn_prompt = _render_syn(opposed)
+    synthesized = provider.complete(
+        syn_prompt,
+        temperature=t_syn,
+        max_tokens=_MAX_TOKENS["syn"],
+        **_tier_option(provider.complete, syn_tier),
+    )
 
     return {"generate": generated, "oppose": opposed, "synthesize": synthesized}
 
 
+def _oppose(provider: LLMProvider, generated: str, temperature: float, tier: Tier) -> str:
+    # Submit both sub-queries before waiting on either.
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        tensions = pool.submit(
+            provider.complete,
+            _render_opp_tensions(generated),
+            temperature=temperature,
+            max_tokens=_MAX_TOKENS["opp"],
+            **_tier_option(provider.complete, tier),
+        )
+        approaches = pool.submit(
+            provider.complete,
+            _render_opp_approaches(generated),
+            temperature=temperature,
+            max_tokens=_MAX_TOKENS["opp"],
+            **_tier_option(provider.complete, tier),
+        )
+        return _join_oppose(tensions.result(), approaches.result())
+
+
+def _remember_generate(gen_prompt: str, generated: str) -> None:
+    _GENERATE_HISTORY[gen_prompt] = generated
+    _GENERATE_HISTORY.move_to_end(gen_prompt)
+    if len(_GENERATE_HISTORY) > _GENERATE_HISTORY_SIZE:
+        _GENERATE_HISTORY.popitem(last=False)
+
+
+async def _oppose_async(
+    provider: LLMProvider, generated: str, temperature: float, tier: Tier
+) -> str:
+    options: Dict[str, Any] = {
+        "temperature": temperature,
+        "max_tokens": _MAX_TOKENS["opp"],
+        **_tier_option(provider.acomplete, tier),
+    }
+    tensions, approaches = await asyncio.gather(
+        provider.acomplete(_render_opp_tensions(generated), **options),
+        provider.acomplete(_render_opp_approaches(generated), **options),
+    )
+    return _join_oppose(tensions, approaches)
+
+
+async def _generate_async(
+    provider: LLMProvider,
+    gen_prompt: str,
+    t_gen: float,
+    t_opp: float,
+    gen_tier: Tier,
+    opp_tier: Tier,
+) -> Tuple[str, Optional["asyncio.Task[str]"]]:
+    """Run the Generate phase, speculatively starting Oppose when possible.
+
+    Generate is always token-streamed.  At low temperature the last Generate
+    output for ``gen_prompt`` is also used as a prediction: once the first
+    ``SPECULATION_PREFIX_TOKENS`` chunks agree with the prediction, Oppose is
+    started on the predicted text.  The running Oppose task is returned only
+    when the finished Generate output matches the prediction exactly;
+    otherwise it is cancelled and the caller issues Oppose on the real output.
+    """
+
+    speculate = t_gen < SPECULATION_MAX_TEMPERATURE
+    predicted = _GENERATE_HISTORY.get(gen_prompt) if speculate else None
+    speculative: Optional["asyncio.Task[str]"] = None
+    parts: list[str] = []
+    try:
+        async for token in provider.acomplete_stream(
+            gen_prompt,
+            temperature=t_gen,
+            max_tokens=_MAX_TOKENS["gen"],
+            **_tier_option(provider.acomplete_stream, gen_tier),
+        ):
+            parts.append(token)
+            if (
+                predicted is not None
+                and speculative is None
+                and len(parts) == SPECULATION_PREFIX_TOKENS
+                and predicted.startswith("".join(parts).lstrip())
+            ):
+                speculative = asyncio.create_task(
+                    _oppose_async(provider, predicted, t_opp, opp_tier)
+                )
+        generated = "".join(parts).strip()
+    except BaseException:
+        if speculative is not None:
+            speculative.cancel()
+        raise
+
+    if speculate:
+        _remember_generate(gen_prompt, generated)
+    if speculative is not None and generated != predicted:
+        speculative.cancel()
+        speculative = None
+    return generated, speculative
+
+
+async def iter_trinity_loop_async(
+    topic: str,
+    goal: str = "clarity",
+    constraints: str = "realistic",
+    *,
+    provider: Optional[LLMProvider] = None,
+    temperature: float = 0.7,
+    tiers: Tuple[Tier, Tier, Tier] = DEFAULT_TIERS,
+) -> AsyncIterator[Tuple[str, str]]:
+    """Yield ``(phase, output)`` pairs as each phase of the loop completes.
+
+    Lets callers such as the streaming API endpoint forward the Generate
+    result while Oppose and Synthesize are still running.
+    """
+
+    provider = provider or get_default_provider()
+    t_gen, t_opp, t_syn = _phase_temps(temperature)
+    gen_tier, opp_tier, syn_tier = tiers
+
+    gen_prompt = _render_gen(topic, goal, constraints)
+    generated, speculative = await _generate_async(
+        provider, gen_prompt, t_gen, t_opp, gen_tier, opp_tier
+    )
+    try:
+        yield "generate", generated
+        if speculative is not None:
+            opposed = await speculative
+        else:
+            opposed = await _oppose_async(provider, generated, t_opp, opp_tier)
+    finally:
+        # Only matters when the consumer stops early; a finished task ignores it.
+        if speculative is not None:
+            speculative.cancel()
+    yield "oppose", opposed
+
+    syn_prompt = _render_syn(opposed)
+    synthesized = await provider.acomplete(
+        syn_prompt,
+        temperature=t_syn,
+        max_tokens=_MAX_TOKENS["syn"],
+        **_tier_option(provider.acomplete, syn_tier),
+    )
+    yield "synthesize", synthesized
+
+
+async def run_trinity_loop_async(
+    topic: str,
+    goal: str = "clarity",
+    constraints: str = "realistic",
+    *,
+    provider: Optional[LLMProvider] = None,
+    temperature: float = 0.7,
+    tiers: Tuple[Tier, Tier, Tier] = DEFAULT_TIERS,
+) -> Dict[str, str]:
+    """Asynchronous variant of :func:`run_trinity_loop`.
+
+    The phases still run one after another, but each completion is awaited so
+    an event loop (for example the FastAPI service) can serve other requests
+    while the model is busy.
+    """
+
+    return {
+        phase: output
+        async for phase, output in iter_trinity_loop_async(
+            topic,
+            goal,
+            constraints,
+            provider=provider,
+            temperature=temperature,
+            tiers=tiers,
+        )
+    }
+
+
 def boot_moonlander_mode(
     config: TrinityConfig,
     *,
@@ -133,23 +1120,28 @@ def boot_moonlander_mode(
         constraints=config.constraints,
         provider=provider,
         temperature=temperature,
+        tiers=config.tiers,
     )
 
 
+_join_lines = "\n".join
+
+
 def _format_results(results: Dict[str, str]) -> str:
-    sections = [
-        "🚀 Trinity Mind // Moonlander Mode",
-        "",
-        "[Generate]",
-        results["generate"],
-        "",
-        "[Oppose]",
-        results["oppose"],
-        "",
-        "[Synthesize]",
-        results["synthesize"],
-    ]
-    return "\n".join(sections)
+    return _join_lines(
+        (
+            "🚀 Trinity Mind // Moonlander Mode",
+            "",
+            "[Generate]",
+            results["generate"],
+            "",
+            "[Oppose]",
+            results["oppose"],
+            "",
+            "[Synthesize]",
+            results["synthesize"],
+        )
+    )
 
 
 def run_moonlander_cli(
@@ -176,6 +1168,7 @@ def main(argv: Optional[list[str]] = None) -> None:
     """
 
     import argparse
+    import json
 
     parser = argparse.ArgumentParser(description="Boot Trinity Mind // Moonlander Mode")
     parser.add_argument("--topic", help="Topic the engine should explore")
@@ -215,7 +1208,12 @@ def main(argv: Optional[list[str]] = None) -> None:
         temperature=args.temperature,
     )
     if args.format == "json":
-        print(json.dumps(results, indent=2))
+        try:
+            import orjson  # type: ignore
+        except ImportError:
+            print(json.dumps(results, indent=2))
+        else:
+            print(orjson.dumps(results, option=orjson.OPT_INDENT_2).decode())
     else:
         print(_format_results(results))
 